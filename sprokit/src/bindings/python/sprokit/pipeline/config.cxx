@@ -74,6 +74,8 @@ static void config_setitem( kwiver::vital::config_block_sptr          self,
                             object const&                             value );
 static void config_delitem( kwiver::vital::config_block_sptr          self,
                             kwiver::vital::config_block_key_t const&  key );
+static void config_update( kwiver::vital::config_block_sptr self,
+                           dict const&                      values );
 
 
 PYBIND11_MODULE(config, m)
@@ -102,6 +104,10 @@ PYBIND11_MODULE(config, m)
     .def("set_value", &config_set_value
       , arg("key"), arg("value")
       , "Set a value in the configuration.")
+    .def("update", &config_update
+      , arg("values")
+      , "Set multiple values in the configuration from a dictionary. "
+        "If any key is read only, nothing is changed and an exception is raised.")
     .def("unset_value", &kwiver::vital::config_block::unset_value
       , arg("key")
       , "Unset a value in the configuration.")
@@ -218,3 +224,21 @@ config_delitem( kwiver::vital::config_block_sptr          self,
     throw error_already_set();
   }
 }
+
+
+void
+config_update( kwiver::vital::config_block_sptr self,
+               dict const&                      values )
+{
+  kwiver::vital::config_block_entries_t entries;
+
+  for ( auto const& item : values )
+  {
+    kwiver::vital::config_block_key_t const& key = item.first.cast< kwiver::vital::config_block_key_t >();
+    kwiver::vital::config_block_value_t const& str_value = str( item.second );
+
+    entries.push_back( kwiver::vital::config_block_entries_t::value_type( key, str_value ) );
+  }
+
+  self->set_values( entries );
+}
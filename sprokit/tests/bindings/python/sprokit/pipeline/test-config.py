@@ -29,10 +29,22 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+BLOCK1 = 'block1'
+BLOCK2 = 'block2'
+
+KEYA = 'keya'
+KEYB = 'keyb'
+KEYC = 'keyc'
+
+VALUEA = 'valuea'
+VALUEB = 'valueb'
+VALUEC = 'valuec'
+
+
 def test_import():
     try:
         import sprokit.pipeline.config
-    except:
+    except ImportError:
         test_error("Failed to import the config module")
 
 
@@ -59,17 +71,12 @@ def test_has_value():
 
     c = config.empty_config()
 
-    keya = 'keya'
-    keyb = 'keyb'
+    c.set_value(KEYA, VALUEA)
 
-    valuea = 'valuea'
-
-    c.set_value(keya, valuea)
-
-    if not c.has_value(keya):
+    if not c.has_value(KEYA):
         test_error("Block does not have value which was set")
 
-    if c.has_value(keyb):
+    if c.has_value(KEYB):
         test_error("Block has value which was not set")
 
 
@@ -78,15 +85,11 @@ def test_get_value():
 
     c = config.empty_config()
 
-    keya = 'keya'
-
-    valuea = 'valuea'
-
-    c.set_value(keya, valuea)
+    c.set_value(KEYA, VALUEA)
 
-    get_valuea = c.get_value(keya)
+    get_valuea = c.get_value(KEYA)
 
-    if not valuea == get_valuea:
+    if VALUEA != get_valuea:
         test_error("Did not retrieve value that was set")
 
 
@@ -95,18 +98,15 @@ def test_get_value_nested():
 
     c = config.empty_config()
 
-    keya = 'keya'
-    keyb = 'keyb'
+    sep = config.Config.block_sep
 
-    valuea = 'valuea'
+    c.set_value(KEYA + sep + KEYB, VALUEA)
 
-    c.set_value(keya + config.Config.block_sep + keyb, valuea)
+    nc = c.subblock(KEYA)
 
-    nc = c.subblock(keya)
+    get_valuea = nc.get_value(KEYB)
 
-    get_valuea = nc.get_value(keyb)
-
-    if not valuea == get_valuea:
+    if VALUEA != get_valuea:
         test_error("Did not retrieve value that was set")
 
 
@@ -115,17 +115,12 @@ def test_get_value_no_exist():
 
     c = config.empty_config()
 
-    keya = 'keya'
-    keyb = 'keyb'
-
-    valueb = 'valueb'
-
     expect_exception('retrieving an unset value', BaseException,
-                     c.get_value, keya)
+                     c.get_value, KEYA)
 
-    get_valueb = c.get_value(keyb, valueb)
+    get_valueb = c.get_value(KEYB, VALUEB)
 
-    if not valueb == get_valueb:
+    if VALUEB != get_valueb:
         test_error("Did not retrieve default when requesting unset value")
 
 
@@ -134,23 +129,17 @@ def test_unset_value():
 
     c = config.empty_config()
 
-    keya = 'keya'
-    keyb = 'keyb'
-
-    valuea = 'valuea'
-    valueb = 'valueb'
-
-    c.set_value(keya, valuea)
-    c.set_value(keyb, valueb)
+    c.update({KEYA: VALUEA,
+              KEYB: VALUEB})
 
-    c.unset_value(keya)
+    c.unset_value(KEYA)
 
     expect_exception('retrieving an unset value', BaseException,
-                     c.get_value, keya)
+                     c.get_value, KEYA)
 
-    get_valueb = c.get_value(keyb)
+    get_valueb = c.get_value(KEYB)
 
-    if not valueb == get_valueb:
+    if VALUEB != get_valueb:
         test_error("Did not retrieve value when requesting after an unrelated unset")
 
 
@@ -159,47 +148,130 @@ def test_available_values():
 
     c = config.empty_config()
 
-    keya = 'keya'
-    keyb = 'keyb'
-
-    valuea = 'valuea'
-    valueb = 'valueb'
-
-    c.set_value(keya, valuea)
-    c.set_value(keyb, valueb)
+    c.update({KEYA: VALUEA,
+              KEYB: VALUEB})
 
     avail = c.available_values()
 
-    if not len(avail) == 2:
+    if len(avail) != 2:
         test_error("Did not retrieve correct number of keys")
 
     try:
-        for val in avail:
-            pass
-    except:
+        iter(avail)
+    except TypeError:
         test_error("Available values is not iterable")
 
 
-def test_read_only():
+def test_update():
+    from sprokit.pipeline import config
+
+    c = config.empty_config()
+
+    c.set_value(KEYA, VALUEA)
+
+    c.update({KEYA: VALUEB,
+              KEYB: 10})
+
+    get_valuea = c.get_value(KEYA)
+
+    if VALUEB != get_valuea:
+        test_error("Update did not overwrite an existing value")
+
+    get_valueb = c.get_value(KEYB)
+
+    if '10' != get_valueb:
+        test_error("Update did not convert a value to a string")
+
+    c.mark_read_only(KEYA)
+
+    expect_exception('updating a read only value', BaseException,
+                     c.update, {KEYA: VALUEC})
+
+    get_valuea = c.get_value(KEYA)
+
+    if VALUEB != get_valuea:
+        test_error("Update changed a read only value")
+
+    expect_exception('updating with a read only key', BaseException,
+                     c.update, {KEYC: VALUEC,
+                                KEYA: VALUEA})
+
+    if c.has_value(KEYC):
+        test_error("Failed update set a writable value")
+
+    get_valuea = c.get_value(KEYA)
+
+    if VALUEB != get_valuea:
+        test_error("Update changed a read only value")
+
+
+def test_update_read_only_no_value():
+    from sprokit.pipeline import config
+
+    c = config.empty_config()
+
+    c.mark_read_only(KEYA)
+
+    expect_exception('updating a read only key with no value', BaseException,
+                     c.update, {KEYB: VALUEB,
+                                KEYA: VALUEA})
+
+    if c.has_value(KEYA):
+        test_error("Update set a read only key")
+
+    if c.has_value(KEYB):
+        test_error("Failed update set a writable value")
+
+
+def test_update_subblock_view():
     from sprokit.pipeline import config
 
     c = config.empty_config()
 
-    keya = 'keya'
+    sep = config.Config.block_sep
+
+    block1_keya = BLOCK1 + sep + KEYA
+    block1_keyb = BLOCK1 + sep + KEYB
+
+    c.set_value(block1_keya, VALUEA)
+    c.mark_read_only(block1_keya)
+
+    d = c.subblock_view(BLOCK1)
+
+    expect_exception('updating a view with a read only key in the parent', BaseException,
+                     d.update, {KEYB: VALUEB,
+                                KEYA: VALUEB})
+
+    if c.has_value(block1_keyb):
+        test_error("Failed update through a view set a writable value")
+
+    get_valuea = c.get_value(block1_keya)
+
+    if VALUEA != get_valuea:
+        test_error("Update through a view changed a read only value")
 
-    valuea = 'valuea'
-    valueb = 'valueb'
+    d.update({KEYB: VALUEB})
 
-    c.set_value(keya, valuea)
+    get_valueb = c.get_value(block1_keyb)
 
-    c.mark_read_only(keya)
+    if VALUEB != get_valueb:
+        test_error("Update through a view was not changed in parent")
+
+def test_read_only():
+    from sprokit.pipeline import config
+
+    c = config.empty_config()
+
+    c.set_value(KEYA, VALUEA)
+
+    c.mark_read_only(KEYA)
 
     expect_exception('setting a read only value', BaseException,
-                     c.set_value, keya, valueb)
+                     c.set_value, KEYA, VALUEB)
 
-    get_valuea = c.get_value(keya)
+    get_valuea = c.get_value(KEYA)
 
-    if not valuea == get_valuea:
+    if VALUEA != get_valuea:
         test_error("Read only value changed")
 
 
@@ -208,20 +280,16 @@ def test_read_only_unset():
 
     c = config.empty_config()
 
-    keya = 'keya'
-
-    valuea = 'valuea'
-
-    c.set_value(keya, valuea)
+    c.set_value(KEYA, VALUEA)
 
-    c.mark_read_only(keya)
+    c.mark_read_only(KEYA)
 
     expect_exception('unsetting a read only value', BaseException,
-                     c.unset_value, keya)
+                     c.unset_value, KEYA)
 
-    get_valuea = c.get_value(keya)
+    get_valuea = c.get_value(KEYA)
 
-    if not valuea == get_valuea:
+    if VALUEA != get_valuea:
         test_error("Read only value was unset")
 
 
@@ -230,34 +298,25 @@ def test_subblock():
 
     c = config.empty_config()
 
-    block1 = 'block1'
-    block2 = 'block2'
+    sep = config.Config.block_sep
 
-    keya = 'keya'
-    keyb = 'keyb'
-    keyc = 'keyc'
+    c.update({BLOCK1 + sep + KEYA: VALUEA,
+              BLOCK1 + sep + KEYB: VALUEB,
+              BLOCK2 + sep + KEYC: VALUEC})
 
-    valuea = 'valuea'
-    valueb = 'valueb'
-    valuec = 'valuec'
+    d = c.subblock(BLOCK1)
 
-    c.set_value(block1 + config.Config.block_sep + keya, valuea)
-    c.set_value(block1 + config.Config.block_sep + keyb, valueb)
-    c.set_value(block2 + config.Config.block_sep + keyc, valuec)
+    get_valuea = d.get_value(KEYA)
 
-    d = c.subblock(block1)
-
-    get_valuea = d.get_value(keya)
-
-    if not valuea == get_valuea:
+    if VALUEA != get_valuea:
         test_error("Subblock does not inherit expected keys")
 
-    get_valueb = d.get_value(keyb)
+    get_valueb = d.get_value(KEYB)
 
-    if not valueb == get_valueb:
+    if VALUEB != get_valueb:
         test_error("Subblock does not inherit expected keys")
 
-    if d.has_value(keyc):
+    if d.has_value(KEYC):
         test_error("Subblock inherited unrelated key")
 
 
@@ -266,40 +325,39 @@ def test_subblock_view():
 
     c = config.empty_config()
 
-    block1 = 'block1'
-    block2 = 'block2'
+    sep = config.Config.block_sep
 
-    keya = 'keya'
-    keyb = 'keyb'
-    keyc = 'keyc'
+    block1_keya = BLOCK1 + sep + KEYA
+    block2_keyb = BLOCK2 + sep + KEYB
 
-    valuea = 'valuea'
-    valueb = 'valueb'
-    valuec = 'valuec'
+    c.update({block1_keya: VALUEA,
+              block2_keyb: VALUEB})
 
-    c.set_value(block1 + config.Config.block_sep + keya, valuea)
-    c.set_value(block2 + config.Config.block_sep + keyb, valueb)
+    d = c.subblock_view(BLOCK1)
 
-    d = c.subblock_view(block1)
-
-    if not d.has_value(keya):
+    if not d.has_value(KEYA):
         test_error("Subblock does not inherit expected keys")
 
-    if d.has_value(keyb):
+    if d.has_value(KEYB):
         test_error("Subblock inherited unrelated key")
 
-    c.set_value(block1 + config.Config.block_sep + keya, valueb)
+    c.set_value(block1_keya, VALUEB)
 
-    get_valuea1 = d.get_value(keya)
+    get_valuea1 = d.get_value(KEYA)
 
-    if not valueb == get_valuea1:
+    if VALUEB != get_valuea1:
         test_error("Subblock view persisted a changed value")
 
-    d.set_value(keya, valuea)
+    d.set_value(KEYA, VALUEA)
+
+    get_valuea2 = d.get_value(KEYA)
 
-    get_valuea2 = d.get_value(keya)
+    if VALUEA != get_valuea2:
+        test_error("Subblock view set value was not changed in the view")
 
-    if not valuea == get_valuea2:
+    get_valuea3 = c.get_value(block1_keya)
+
+    if VALUEA != get_valuea3:
         test_error("Subblock view set value was not changed in parent")
 
 
@@ -309,35 +367,27 @@ def test_merge_config():
     c = config.empty_config()
     d = config.empty_config()
 
-    keya = 'keya'
-    keyb = 'keyb'
-    keyc = 'keyc'
-
-    valuea = 'valuea'
-    valueb = 'valueb'
-    valuec = 'valuec'
+    c.update({KEYA: VALUEA,
+              KEYB: VALUEA})
 
-    c.set_value(keya, valuea)
-    c.set_value(keyb, valuea)
-
-    d.set_value(keyb, valueb)
-    d.set_value(keyc, valuec)
+    d.update({KEYB: VALUEB,
+              KEYC: VALUEC})
 
     c.merge_config(d)
 
-    get_valuea = c.get_value(keya)
+    get_valuea = c.get_value(KEYA)
 
-    if not valuea == get_valuea:
+    if VALUEA != get_valuea:
         test_error("Unmerged key changed")
 
-    get_valueb = c.get_value(keyb)
+    get_valueb = c.get_value(KEYB)
 
-    if not valueb == get_valueb:
+    if VALUEB != get_valueb:
         test_error("Conflicting key was not overwritten")
 
-    get_valuec = c.get_value(keyc)
+    get_valuec = c.get_value(KEYC)
 
-    if not valuec == get_valuec:
+    if VALUEC != get_valuec:
         test_error("New key did not appear")
 
 
@@ -357,13 +407,13 @@ def test_dict():
 
     c[key] = value
 
-    if not c[key] == value:
+    if c[key] != value:
         test_error("Value was not set")
 
     if key not in c:
         test_error("'%s' is not in config after insertion" % key)
 
-    if not len(c) == 1:
+    if len(c) != 1:
         test_error("The len() operator is incorrect")
 
     if not c:
@@ -376,7 +426,7 @@ def test_dict():
 
     value = 'replacedvalue'
 
-    if not c[key] == origvalue:
+    if c[key] != origvalue:
         test_error("Value was overwritten")
 
     del c[key]
@@ -391,7 +441,7 @@ def test_dict():
 
     c[key] = value
 
-    if not c[key] == str(value):
+    if c[key] != str(value):
         test_error("Value was not converted to a string")
 
 
@@ -399,16 +449,19 @@ def test_dict():
     import os
     import sys
 
-    if not len(sys.argv) == 4:
+    if len(sys.argv) != 4:
         test_error("Expected three arguments")
         sys.exit(1)
 
     testname = sys.argv[1]
 
-    os.chdir(sys.argv[2])
+    target_dir = os.path.abspath(sys.argv[2])
+
+    if os.getcwd() != target_dir:
+        os.chdir(target_dir)
 
     sys.path.append(sys.argv[3])
 
-    from sprokit.test.test import *
+    from sprokit.test.test import expect_exception, find_tests, run_test, test_error
 
     run_test(testname, find_tests(locals()))
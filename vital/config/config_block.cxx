@@ -155,6 +155,44 @@ ::get_description( config_block_key_t const& key ) const
 }
 
 
+// ------------------------------------------------------------------
+// Set multiple values in the configuration.
+void
+config_block
+::set_values( config_block_entries_t const& entries )
+{
+  if ( m_parent )
+  {
+    config_block_entries_t parent_entries;
+
+    for( config_block_entries_t::value_type const& entry : entries )
+    {
+      parent_entries.push_back(
+        config_block_entries_t::value_type( m_name + block_sep + entry.first, entry.second ) );
+    }
+
+    m_parent->set_values( parent_entries );
+    return;
+  }
+
+  // Check every key first so that a read-only key leaves the block unchanged.
+  for( config_block_entries_t::value_type const& entry : entries )
+  {
+    if ( is_read_only( entry.first ) )
+    {
+      config_block_value_t const current_value = get_value< config_block_value_t > ( entry.first, config_block_value_t() );
+
+      VITAL_THROW( set_on_read_only_value_exception, entry.first, current_value, entry.second );
+    }
+  }
+
+  for( config_block_entries_t::value_type const& entry : entries )
+  {
+    i_set_value( entry.first, entry.second );
+  }
+}
+
+
 // ------------------------------------------------------------------
 // Remove a value from the configuration.
 void
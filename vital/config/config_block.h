@@ -272,6 +272,22 @@ class VITAL_CONFIG_EXPORT config_block
   void set_value( config_block_key_t const& key,
                   T const&                  value);
 
+  /// Set multiple values within the configuration.
+  /**
+   * Every key is checked before any value is written. If any key is
+   * read-only, an exception is thrown and the configuration is left
+   * unchanged. For a subblock view, keys are checked against the block
+   * that actually stores them.
+   *
+   * Existing descriptions are retained, as with \c set_value.
+   *
+   * \throws set_on_read_only_value_exception Thrown if any key in \p entries
+   *   is marked as read-only.
+   *
+   * \param entries The key/value pairs to set.
+   */
+  void set_values( config_block_entries_t const& entries );
+
   /// Remove a value from the configuration.
   /**
    * \throws unset_on_read_only_value_exception Thrown if \p key is marked as read-only.
@@ -33,6 +33,7 @@
 
 #include <string>
 #include <memory>
+#include <utility>
 #include <vector>
 
 //
@@ -53,6 +54,9 @@ typedef std::vector<config_block_key_t> config_block_keys_t;
 /// The type that represents a stored configuration value.
 typedef std::string config_block_value_t;
 
+/// The type that represents a collection of configuration key/value pairs.
+typedef std::vector< std::pair< config_block_key_t, config_block_value_t > > config_block_entries_t;
+
 /// The type that represents a description of a configuration key.
 typedef std::string config_block_description_t;
 
@@ -256,6 +256,66 @@ TEST(config_block, read_only)
   EXPECT_EQ( valuea, config->get_value<config_block_value_t>( keya ) );
 }
 
+// ----------------------------------------------------------------------------
+TEST(config_block, set_values)
+{
+  auto const config = config_block::empty_config();
+
+  config->set_value( keya, valuea );
+
+  config->set_values( { { keya, valueb }, { keyb, valueb } } );
+
+  EXPECT_EQ( valueb, config->get_value<config_block_value_t>( keya ) );
+  EXPECT_EQ( valueb, config->get_value<config_block_value_t>( keyb ) );
+
+  config->mark_read_only( keya );
+
+  // A read-only key after a writable one must not leave a partial write
+  EXPECT_THROW( config->set_values( { { keyc, valuec }, { keya, valuea } } ),
+                set_on_read_only_value_exception );
+
+  EXPECT_FALSE( config->has_value( keyc ) );
+  EXPECT_EQ( valueb, config->get_value<config_block_value_t>( keya ) );
+}
+
+// ----------------------------------------------------------------------------
+TEST(config_block, set_values_read_only_unset)
+{
+  auto const config = config_block::empty_config();
+
+  config->mark_read_only( keya );
+
+  EXPECT_THROW( config->set_values( { { keyb, valueb }, { keya, valuea } } ),
+                set_on_read_only_value_exception );
+
+  EXPECT_FALSE( config->has_value( keya ) );
+  EXPECT_FALSE( config->has_value( keyb ) );
+}
+
+// ----------------------------------------------------------------------------
+TEST(config_block, set_values_subblock_view)
+{
+  auto const config = config_block::empty_config();
+
+  config->set_value( block1_name + config_block::block_sep + keya, valuea );
+  config->mark_read_only( block1_name + config_block::block_sep + keya );
+
+  config_block_sptr const subblock = config->subblock_view( block1_name );
+
+  EXPECT_THROW( subblock->set_values( { { keyb, valueb }, { keya, valueb } } ),
+                set_on_read_only_value_exception );
+
+  EXPECT_FALSE(
+    config->has_value( block1_name + config_block::block_sep + keyb ) );
+  EXPECT_EQ( valuea, config->get_value<config_block_value_t>(
+                       block1_name + config_block::block_sep + keya ) );
+
+  subblock->set_values( { { keyb, valueb } } );
+
+  EXPECT_EQ( valueb, config->get_value<config_block_value_t>(
+                       block1_name + config_block::block_sep + keyb ) );
+}
+
 // ----------------------------------------------------------------------------
 TEST(config_block, subblock)
 {